@@ -3,13 +3,20 @@
 Main FastAPI application entry point.
 """
 
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
 from src.core.config import settings
 from src.core.database import database
+from src.core.responses import ORJSONResponse
 from src.api.routes import router
+from src.api.dependencies import close_services
+
+logging.basicConfig(level=settings.LOG_LEVEL)
 
 
 @asynccontextmanager
@@ -24,6 +31,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print(">> Shutting down...")
+    await close_services()
     await database.disconnect()
 
 
@@ -32,7 +40,8 @@ app = FastAPI(
     title="Extraction Validation Engine API",
     description="AI-powered reinforced concrete extraction and validation",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -44,6 +53,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (geometry, extraction lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=3)
+
 # Include routers
 app.include_router(router)
 
@@ -59,11 +71,23 @@ async def root():
 
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
 
+    # Reload mode only supports a single worker process
+    if settings.API_RELOAD:
+        workers = 1
+    else:
+        workers = settings.API_WORKERS or max(2, os.cpu_count() or 1)
+
     uvicorn.run(
         "main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
-        reload=settings.API_RELOAD
+        reload=settings.API_RELOAD,
+        workers=workers,
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
@@ -0,0 +1,48 @@
+# File: backend/src/api/dependencies.py
+"""
+Lazily constructed service singletons shared by the API routes.
+"""
+
+from functools import lru_cache
+
+import httpx
+
+from ..services.gemini_extractor import GeminiExtractor
+from ..services.aci_validator import ACIValidator
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared keep-alive HTTP client for outbound API calls.
+
+    HTTP/2 multiplexes concurrent Gemini requests over a few connections,
+    so each request skips the TCP and TLS handshake.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_gemini_extractor() -> GeminiExtractor:
+    """Process-wide Gemini extractor, created on first use."""
+    return GeminiExtractor(http_client=get_http_client())
+
+
+@lru_cache(maxsize=1)
+def get_aci_validator() -> ACIValidator:
+    """Process-wide ACI validator, created on first use."""
+    return ACIValidator()
+
+
+async def close_services() -> None:
+    """Release network resources held by services that were created."""
+    if get_gemini_extractor.cache_info().currsize:
+        await get_gemini_extractor().aclose()
+        get_gemini_extractor.cache_clear()
+
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
@@ -3,29 +3,214 @@
 FastAPI routes for extraction and validation workflow.
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Body
-from fastapi.responses import JSONResponse
-from typing import Optional
+import base64
+import hashlib
+import logging
+import traceback
+
+import orjson
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, UploadFile, File, HTTPException, Body, Depends, Header, Response
+from fastapi.responses import StreamingResponse
+from pymongo import UpdateOne
+from typing import List, Optional, Tuple
 from datetime import datetime
+from collections import OrderedDict
 
 from ..models.schemas import ColumnExtraction
 from ..services.gemini_extractor import GeminiExtractor
-from ..services.aci_validator import ACIValidator, ExposureCondition
+from ..services.aci_validator import ExposureCondition
 from ..services.geometry_calculator import GeometryCalculator
 from ..core.database import database
 from ..core.config import settings
+from ..core.responses import ORJSONResponse, json_dumps
+from .dependencies import get_aci_validator, get_gemini_extractor
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1")
 
-# Initialize services
-gemini_extractor = GeminiExtractor()
-aci_validator = ACIValidator()
+# Listing returns summaries only; full documents come from GET /extractions/{id}
+LIST_PROJECTION = {
+    "element_identification": 1,
+    "geometry.cross_section_type": 1,
+    "validated": 1,
+    "saved_at": 1,
+}
+MAX_LIST_LIMIT = 100
+MAX_BATCH_FILES = 20
+
+# Only the timestamps are needed to revalidate a cached extraction
+VERSION_PROJECTION = {"saved_at": 1, "updated_at": 1}
+
+
+# Healing cache: (payload digest, exposure) -> serialized heal result, LRU order
+HEAL_CACHE_SIZE = 512
+HEAL_CACHE_MAX_PAYLOAD_BYTES = 32 * 1024
+# Per-request metadata that does not affect healing; kept out of the key
+HEAL_VOLATILE_FIELDS = ("extracted_at", "validated", "validation_notes")
+
+_heal_cache: "OrderedDict[Tuple[bytes, ExposureCondition], Tuple[bytes, Tuple[str, ...]]]" = OrderedDict()
+
+
+def restore_volatile_fields(original: dict, healed: dict) -> dict:
+    """Put the original volatile metadata back, keeping the input key order."""
+    restored = {
+        key: original[key] if key in HEAL_VOLATILE_FIELDS else healed[key]
+        for key in original
+        if key in HEAL_VOLATILE_FIELDS or key in healed
+    }
+    restored.update((key, value) for key, value in healed.items() if key not in restored)
+    return restored
+
+
+def heal_extraction_cached(
+    extraction_data: dict,
+    exposure: ExposureCondition
+) -> Tuple[dict, List[str]]:
+    """
+    Apply ACI healing, reusing the result for repeated extractions.
+
+    ACI rules are deterministic, so identical payloads always heal to the
+    same result. Results are keyed on a digest of the payload without its
+    volatile metadata (HEAL_VOLATILE_FIELDS), which is restored on the
+    returned data. Hits are stored serialized so every caller gets fresh
+    objects; payloads above HEAL_CACHE_MAX_PAYLOAD_BYTES are healed
+    without caching. The input is never mutated: misses heal a copy
+    decoded from the payload, so hits and misses behave the same.
+    """
+    stable = {
+        key: value
+        for key, value in extraction_data.items()
+        if key not in HEAL_VOLATILE_FIELDS
+    }
+    payload = orjson.dumps(stable)
+    cache_key = None
+
+    if len(payload) <= HEAL_CACHE_MAX_PAYLOAD_BYTES:
+        cache_key = (hashlib.blake2b(payload, digest_size=16).digest(), exposure)
+        cached = _heal_cache.get(cache_key)
+        if cached is not None:
+            _heal_cache.move_to_end(cache_key)
+            healed_bytes, corrections = cached
+            healed = orjson.loads(healed_bytes)
+            return restore_volatile_fields(extraction_data, healed), list(corrections)
+
+    # heal_extraction writes into nested dicts; heal a fresh decode rather
+    # than `stable`, which still shares them with the caller
+    healed, corrections = get_aci_validator().heal_extraction(
+        orjson.loads(payload), exposure=exposure
+    )
+
+    if cache_key is not None:
+        _heal_cache[cache_key] = (orjson.dumps(healed), tuple(corrections))
+        if len(_heal_cache) > HEAL_CACHE_SIZE:
+            _heal_cache.popitem(last=False)
+
+    return restore_volatile_fields(extraction_data, healed), corrections
+
+
+def parse_object_id(extraction_id: str) -> ObjectId:
+    """Parse the extraction_id path parameter, rejecting malformed IDs."""
+    try:
+        return ObjectId(extraction_id)
+    except InvalidId:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid extraction ID: {extraction_id}"
+        )
+
+
+def encode_list_cursor(document: dict) -> str:
+    """
+    Build an opaque keyset cursor from the last document of a page.
+
+    The cursor carries both sort keys (saved_at, _id) so documents that
+    share a saved_at timestamp, such as one bulk insert, are not skipped.
+    """
+    raw = f"{document['saved_at'].isoformat()}|{document['_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def parse_list_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Decode a cursor from encode_list_cursor, rejecting malformed values."""
+    try:
+        saved_at, object_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(saved_at), ObjectId(object_id)
+    except (ValueError, InvalidId):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid cursor: {cursor}"
+        )
+
+
+def extraction_etag(object_id: ObjectId, document: dict) -> str:
+    """Build a weak ETag from an extraction's ID and last write time."""
+    version = document.get("updated_at") or document.get("saved_at")
+    digest = hashlib.blake2b(
+        f"{object_id}:{version}".encode(),
+        digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+async def read_upload(
+    file: UploadFile,
+    chunk_size: int = 64 * 1024,
+    batch_remaining: Optional[int] = None
+) -> bytes:
+    """
+    Read an uploaded file in chunks, enforcing the upload size limits.
+
+    Oversized uploads are rejected as soon as the limit is crossed instead
+    of after the whole body has been buffered in memory.
+
+    Args:
+        file: Uploaded file
+        chunk_size: Bytes read per chunk
+        batch_remaining: Bytes left in the batch upload budget, if any
+    """
+    max_bytes = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Image exceeds {settings.MAX_UPLOAD_SIZE_MB}MB upload limit"
+    )
+    batch_too_large = HTTPException(
+        status_code=413,
+        detail=f"Batch exceeds {settings.MAX_BATCH_UPLOAD_SIZE_MB}MB upload limit"
+    )
+
+    if file.size is not None:
+        if file.size > max_bytes:
+            raise too_large
+        if batch_remaining is not None and file.size > batch_remaining:
+            raise batch_too_large
+
+    buffer = bytearray()
+    while chunk := await file.read(chunk_size):
+        buffer += chunk
+        if len(buffer) > max_bytes:
+            raise too_large
+        if batch_remaining is not None and len(buffer) > batch_remaining:
+            raise batch_too_large
+
+    return bytes(buffer)
 
 
 @router.post("/extract")
 async def extract_from_image(
     file: UploadFile = File(...),
-    auto_validate: bool = True
+    auto_validate: bool = True,
+    gemini_extractor: GeminiExtractor = Depends(get_gemini_extractor)
 ):
     """
     Extract column data from an uploaded image using Gemini 3.
@@ -33,6 +218,7 @@ async def extract_from_image(
     Args:
         file: Uploaded image file (PNG, JPG, JPEG)
         auto_validate: Whether to automatically apply ACI validation/healing
+        gemini_extractor: Shared Gemini extraction service
 
     Returns:
         Extracted and optionally validated column data
@@ -44,33 +230,32 @@ async def extract_from_image(
             detail="File must be an image (PNG, JPG, JPEG)"
         )
 
-    try:
-        # Read image bytes
-        image_bytes = await file.read()
+    image_bytes = await read_upload(file)
 
+    try:
         # Extract using Gemini
         extraction: ColumnExtraction = await gemini_extractor.extract_from_image(
             image_bytes=image_bytes,
             mime_type=file.content_type
         )
 
-        # Convert to dict for processing
-        extraction_dict = extraction.model_dump(mode='json')
+        # Convert to dict for processing (datetimes are serialized by orjson)
+        extraction_dict = extraction.model_dump()
 
         # Apply ACI validation if requested
         corrections = []
         if auto_validate:
-            extraction_dict, corrections = aci_validator.heal_extraction(
+            extraction_dict, corrections = heal_extraction_cached(
                 extraction_dict,
                 exposure=ExposureCondition.INTERIOR_BEAMS_COLUMNS
             )
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "data": extraction_dict,
             "corrections_applied": corrections,
-            "extracted_at": datetime.utcnow().isoformat()
-        }
+            "extracted_at": datetime.utcnow()
+        })
 
     except Exception as e:
         raise HTTPException(
@@ -79,6 +264,105 @@ async def extract_from_image(
         )
 
 
+@router.post("/extract/batch")
+async def extract_batch(
+    files: List[UploadFile] = File(...),
+    auto_validate: bool = True,
+    gemini_extractor: GeminiExtractor = Depends(get_gemini_extractor)
+):
+    """
+    Extract column data from several images concurrently.
+
+    Args:
+        files: Uploaded image files (PNG, JPG, JPEG)
+        auto_validate: Whether to automatically apply ACI validation/healing
+        gemini_extractor: Shared Gemini extraction service
+
+    Returns:
+        One result per file, in upload order. Failed extractions are
+        reported per file without failing the whole batch.
+    """
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_FILES} images per batch"
+        )
+
+    for file in files:
+        if not file.content_type.startswith("image/"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"File must be an image (PNG, JPG, JPEG): {file.filename}"
+            )
+
+    max_batch_bytes = settings.MAX_BATCH_UPLOAD_SIZE_MB * 1024 * 1024
+    if sum(file.size or 0 for file in files) > max_batch_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.MAX_BATCH_UPLOAD_SIZE_MB}MB upload limit"
+        )
+
+    # Stop reading as soon as the combined size crosses the batch budget
+    items = []
+    remaining = max_batch_bytes
+    for file in files:
+        image_bytes = await read_upload(file, batch_remaining=remaining)
+        remaining -= len(image_bytes)
+        items.append((image_bytes, file.content_type))
+
+    try:
+        extractions = await gemini_extractor.extract_batch(items)
+
+        results = []
+        for file, extraction in zip(files, extractions):
+            if isinstance(extraction, BaseException):
+                logger.warning("Extraction failed for %s: %s", file.filename, extraction)
+                results.append({
+                    "filename": file.filename,
+                    "success": False,
+                    "error": f"Extraction failed: {str(extraction)}"
+                })
+                continue
+
+            # A healing failure fails this file only, not the whole batch
+            try:
+                extraction_dict = extraction.model_dump()
+                corrections = []
+                if auto_validate:
+                    extraction_dict, corrections = heal_extraction_cached(
+                        extraction_dict,
+                        exposure=ExposureCondition.INTERIOR_BEAMS_COLUMNS
+                    )
+            except Exception as e:
+                logger.exception("Validation failed for %s", file.filename)
+                results.append({
+                    "filename": file.filename,
+                    "success": False,
+                    "error": f"Validation failed: {str(e)}"
+                })
+                continue
+
+            results.append({
+                "filename": file.filename,
+                "success": True,
+                "data": extraction_dict,
+                "corrections_applied": corrections
+            })
+
+        return ORJSONResponse({
+            "success": True,
+            "count": len(results),
+            "results": results,
+            "extracted_at": datetime.utcnow()
+        })
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch extraction failed: {str(e)}"
+        )
+
+
 @router.post("/validate")
 async def validate_extraction(
     extraction_data: dict = Body(...),
@@ -95,7 +379,7 @@ async def validate_extraction(
         Healed extraction data with corrections listed
     """
     try:
-        healed_data, corrections = aci_validator.heal_extraction(
+        healed_data, corrections = heal_extraction_cached(
             extraction_data,
             exposure=exposure
         )
@@ -114,13 +398,16 @@ async def validate_extraction(
 
 
 @router.post("/geometry")
-async def generate_geometry(
+def generate_geometry(
     extraction_data: dict = Body(...),
     column_height_mm: Optional[float] = None
 ):
     """
     Generate 3D geometry from extraction data.
 
+    Declared as a plain ``def`` so FastAPI runs the CPU-bound calculation
+    in its threadpool instead of blocking the event loop.
+
     Args:
         extraction_data: Validated extraction data
         column_height_mm: Column height (defaults to 3000mm)
@@ -129,31 +416,26 @@ async def generate_geometry(
         3D geometry data ready for Three.js visualization
     """
     try:
-        import sys
-        import json
         height = column_height_mm or settings.DEFAULT_COLUMN_HEIGHT_MM
 
-        print(f"\n{'='*80}", flush=True)
-        print(f"DEBUG: Full extraction_data:", flush=True)
-        print(json.dumps(extraction_data, indent=2, default=str), flush=True)
-        print(f"{'='*80}\n", flush=True)
-        sys.stdout.flush()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("extraction_data=%s", orjson.dumps(extraction_data).decode())
 
         calculator = GeometryCalculator(column_height_mm=height)
         geometry = calculator.generate_complete_geometry(extraction_data)
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "geometry": geometry
-        }
+        })
 
     except Exception as e:
-        import traceback
         error_details = {
             "error": str(e),
-            "type": type(e).__name__,
-            "traceback": traceback.format_exc()
+            "type": type(e).__name__
         }
+        if settings.DEBUG:
+            error_details["traceback"] = traceback.format_exc()
         raise HTTPException(
             status_code=500,
             detail=error_details
@@ -178,14 +460,17 @@ async def save_extraction(
         Saved extraction with MongoDB ID
     """
     try:
-        # Add metadata
-        extraction_data["validated"] = validated
-        extraction_data["validation_notes"] = validation_notes
-        extraction_data["saved_at"] = datetime.utcnow()
+        # Add metadata on a shallow copy so the request body is not mutated
+        document = {
+            **extraction_data,
+            "validated": validated,
+            "validation_notes": validation_notes,
+            "saved_at": datetime.utcnow()
+        }
 
         # Insert into MongoDB
         collection = database.get_collection("extractions")
-        result = await collection.insert_one(extraction_data)
+        result = await collection.insert_one(document)
 
         return {
             "success": True,
@@ -200,23 +485,128 @@ async def save_extraction(
         )
 
 
+@router.post("/extractions/bulk")
+async def save_extractions_bulk(
+    items: List[dict] = Body(...),
+    validated: bool = False,
+    validation_notes: Optional[str] = None
+):
+    """
+    Save many extractions to MongoDB in one round-trip.
+
+    Batches of roughly 32-64 extractions per request are recommended.
+
+    Args:
+        items: Complete extraction documents
+        validated: Whether human has validated (applied to all items)
+        validation_notes: Optional validator notes (applied to all items)
+
+    Returns:
+        MongoDB IDs of the saved extractions, in input order
+    """
+    if not items:
+        raise HTTPException(status_code=400, detail="No extractions provided")
+
+    try:
+        saved_at = datetime.utcnow()
+        documents = [
+            {
+                **item,
+                "validated": validated,
+                "validation_notes": validation_notes,
+                "saved_at": saved_at
+            }
+            for item in items
+        ]
+
+        collection = database.get_collection("extractions")
+        result = await collection.insert_many(documents, ordered=False)
+
+        return {
+            "success": True,
+            "count": len(result.inserted_ids),
+            "ids": [str(inserted_id) for inserted_id in result.inserted_ids]
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Bulk save failed: {str(e)}"
+        )
+
+
+@router.put("/extractions/bulk")
+async def update_extractions_bulk(items: List[dict] = Body(...)):
+    """
+    Update many extractions in a single bulk write.
+
+    Each item must contain its MongoDB ``_id``; all other fields are set
+    on the stored document. Batches of roughly 32-64 items are recommended.
+
+    Args:
+        items: Partial extraction documents, each with an ``_id``
+
+    Returns:
+        Matched and modified document counts
+    """
+    if not items:
+        raise HTTPException(status_code=400, detail="No extractions provided")
+
+    updated_at = datetime.utcnow()
+    operations = []
+    for item in items:
+        if "_id" not in item:
+            raise HTTPException(status_code=400, detail="Every item requires an _id")
+
+        fields = {key: value for key, value in item.items() if key != "_id"}
+        fields["updated_at"] = updated_at
+        operations.append(
+            UpdateOne({"_id": parse_object_id(str(item["_id"]))}, {"$set": fields})
+        )
+
+    try:
+        collection = database.get_collection("extractions")
+        result = await collection.bulk_write(operations, ordered=False)
+
+        return {
+            "success": True,
+            "matched": result.matched_count,
+            "modified": result.modified_count
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Bulk update failed: {str(e)}"
+        )
+
+
 @router.get("/extractions")
 async def list_extractions(
     skip: int = 0,
     limit: int = 20,
-    validated_only: bool = False
+    validated_only: bool = False,
+    before: Optional[str] = None,
+    stream: bool = False
 ):
     """
     List saved extractions from MongoDB.
 
     Args:
-        skip: Number to skip (pagination)
-        limit: Maximum results to return
+        skip: Number to skip (offset pagination)
+        limit: Maximum results to return (clamped to 1-100)
         validated_only: Only return human-validated extractions
+        before: Only return extractions after this position in the listing
+            (keyset pagination; pass the previous page's next_cursor)
+        stream: Stream summaries as NDJSON (one document per line) as they
+            arrive from MongoDB instead of buffering the whole page
 
     Returns:
-        List of extractions
+        List of extraction summaries and the cursor for the next page
     """
+    limit = max(1, min(limit, MAX_LIST_LIMIT))
+    position = parse_list_cursor(before) if before is not None else None
+
     try:
         collection = database.get_collection("extractions")
 
@@ -224,20 +614,42 @@ async def list_extractions(
         query = {}
         if validated_only:
             query["validated"] = True
+        if position is not None:
+            # Resume strictly after the previous page's last (saved_at, _id)
+            saved_at, object_id = position
+            query["$or"] = [
+                {"saved_at": {"$lt": saved_at}},
+                {"saved_at": saved_at, "_id": {"$lt": object_id}},
+            ]
+
+        # Fetch documents (served by the saved_at / validated+saved_at indexes)
+        cursor = (
+            collection.find(query, projection=LIST_PROJECTION)
+            .sort([("saved_at", -1), ("_id", -1)])
+            .skip(skip)
+            .limit(limit)
+        )
+
+        if stream:
+            async def iter_ndjson():
+                async for document in cursor:
+                    yield json_dumps(document) + b"\n"
+
+            return StreamingResponse(iter_ndjson(), media_type="application/x-ndjson")
 
-        # Fetch documents
-        cursor = collection.find(query).skip(skip).limit(limit).sort("saved_at", -1)
         extractions = await cursor.to_list(length=limit)
 
-        # Convert ObjectId to string
-        for ext in extractions:
-            ext["_id"] = str(ext["_id"])
+        next_cursor = None
+        if extractions and len(extractions) == limit:
+            next_cursor = encode_list_cursor(extractions[-1])
 
-        return {
+        # ObjectId and datetime fields are serialized by ORJSONResponse
+        return ORJSONResponse({
             "success": True,
             "count": len(extractions),
-            "data": extractions
-        }
+            "data": extractions,
+            "next_cursor": next_cursor
+        })
 
     except Exception as e:
         raise HTTPException(
@@ -247,32 +659,58 @@ async def list_extractions(
 
 
 @router.get("/extractions/{extraction_id}")
-async def get_extraction(extraction_id: str):
+async def get_extraction(
+    object_id: ObjectId = Depends(parse_object_id),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get a single extraction by ID.
 
+    Responses carry an ETag derived from the last write time. Clients that
+    send it back in If-None-Match get a 304 without the document being
+    fetched or serialized.
+
     Args:
-        extraction_id: MongoDB ObjectId as string
+        object_id: MongoDB ObjectId parsed from the extraction_id path
+        if_none_match: ETag from a previously cached response
 
     Returns:
         Extraction data
     """
     try:
-        from bson import ObjectId
-
         collection = database.get_collection("extractions")
-        extraction = await collection.find_one({"_id": ObjectId(extraction_id)})
+
+        if if_none_match:
+            version = await collection.find_one(
+                {"_id": object_id},
+                projection=VERSION_PROJECTION
+            )
+            if not version:
+                raise HTTPException(status_code=404, detail="Extraction not found")
+
+            etag = extraction_etag(object_id, version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+
+        extraction = await collection.find_one({"_id": object_id})
 
         if not extraction:
             raise HTTPException(status_code=404, detail="Extraction not found")
 
-        extraction["_id"] = str(extraction["_id"])
-
-        return {
-            "success": True,
-            "data": extraction
-        }
+        # Cacheable, but clients must revalidate with the ETag before reuse
+        return ORJSONResponse(
+            {
+                "success": True,
+                "data": extraction
+            },
+            headers={
+                "ETag": extraction_etag(object_id, extraction),
+                "Cache-Control": "no-cache"
+            }
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -282,7 +720,7 @@ async def get_extraction(extraction_id: str):
 
 @router.put("/extractions/{extraction_id}")
 async def update_extraction(
-    extraction_id: str,
+    object_id: ObjectId = Depends(parse_object_id),
     extraction_data: dict = Body(...),
     validated: Optional[bool] = None,
     validation_notes: Optional[str] = None
@@ -291,7 +729,7 @@ async def update_extraction(
     Update an existing extraction.
 
     Args:
-        extraction_id: MongoDB ObjectId as string
+        object_id: MongoDB ObjectId parsed from the extraction_id path
         extraction_data: Updated extraction data
         validated: Update validation status
         validation_notes: Update validation notes
@@ -300,12 +738,10 @@ async def update_extraction(
         Success status
     """
     try:
-        from bson import ObjectId
-
         collection = database.get_collection("extractions")
 
-        # Build update document
-        update_doc = {"$set": extraction_data}
+        # Build update document (copy so the request body is not mutated)
+        update_doc = {"$set": {**extraction_data}}
 
         if validated is not None:
             update_doc["$set"]["validated"] = validated
@@ -317,7 +753,7 @@ async def update_extraction(
 
         # Update
         result = await collection.update_one(
-            {"_id": ObjectId(extraction_id)},
+            {"_id": object_id},
             update_doc
         )
 
@@ -329,6 +765,8 @@ async def update_extraction(
             "message": "Extraction updated successfully"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -3,5 +3,6 @@
 
 from .config import settings
 from .database import database
+from .responses import ORJSONResponse, json_dumps
 
-__all__ = ["settings", "database"]
+__all__ = ["settings", "database", "ORJSONResponse", "json_dumps"]
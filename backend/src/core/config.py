@@ -1,8 +1,9 @@
 # File: backend/src/core/config.py
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -14,23 +15,36 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DATABASE: str = "extraction_validation"
+    MONGODB_MAX_POOL_SIZE: int = 200
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_IDLE_TIME_MS: int = 300_000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_COMPRESSORS: str = "zstd,snappy"
 
     # API Settings
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
-    API_RELOAD: bool = True
+    API_RELOAD: bool = True  # Forces a single worker; disable in production
+    API_WORKERS: Optional[int] = None  # Defaults to max(2, CPU count)
+    MAX_UPLOAD_SIZE_MB: int = 20
+    MAX_BATCH_UPLOAD_SIZE_MB: int = 100  # Combined image size per /extract/batch request
+    LOG_LEVEL: str = "INFO"
+    DEBUG: bool = False  # Include tracebacks in error responses
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins into list."""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+        """Parse CORS origins into list (computed once)."""
+        return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
 
     # Gemini Model Settings
     GEMINI_MODEL: str = "gemini-3-pro-preview"
     GEMINI_THINKING_LEVEL: str = "HIGH"
+    GEMINI_MAX_CONCURRENCY: int = 8  # In-flight requests per batch extraction
+    GEMINI_RETRY_ATTEMPTS: int = 4  # Attempts for rate-limited/5xx calls
+    GEMINI_CACHE_TTL_SECONDS: int = 0  # System prompt context cache TTL (0 = disabled, opt-in)
 
     # Default column height for visualization
     DEFAULT_COLUMN_HEIGHT_MM: float = 3000.0
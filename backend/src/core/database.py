@@ -2,6 +2,7 @@
 """MongoDB database connection and management."""
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
 from typing import Optional
 from .config import settings
 
@@ -14,11 +15,37 @@ class Database:
         self.db: Optional[AsyncIOMotorDatabase] = None
 
     async def connect(self) -> None:
-        """Connect to MongoDB."""
-        self.client = AsyncIOMotorClient(settings.MONGODB_URL)
+        """Connect to MongoDB and warm up the connection pool."""
+        self.client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            compressors=settings.MONGODB_COMPRESSORS,
+            # Naive UTC datetimes serialize directly through orjson
+            tz_aware=False,
+            uuidRepresentation="standard"
+        )
         self.db = self.client[settings.MONGODB_DATABASE]
+
+        # Pay the handshake cost at startup instead of on the first request
+        try:
+            await self.client.admin.command("ping")
+        except PyMongoError as e:
+            print(f">> WARNING: MongoDB not reachable at startup: {e}")
+            return
+
+        await self.ensure_indexes()
         print(f">> Connected to MongoDB: {settings.MONGODB_DATABASE}")
 
+    async def ensure_indexes(self) -> None:
+        """Create the indexes backing the extraction list queries."""
+        extractions = self.get_collection("extractions")
+        # _id breaks ties between documents saved in the same millisecond
+        await extractions.create_index([("saved_at", -1), ("_id", -1)])
+        await extractions.create_index([("validated", 1), ("saved_at", -1), ("_id", -1)])
+
     async def disconnect(self) -> None:
         """Disconnect from MongoDB."""
         if self.client:
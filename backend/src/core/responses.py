@@ -0,0 +1,46 @@
+# File: backend/src/core/responses.py
+"""Fast JSON response class backed by orjson."""
+
+from typing import Any
+
+import numpy as np
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Serialize types orjson does not handle natively.
+
+    Covers MongoDB ObjectIds and NumPy arrays that orjson cannot encode
+    in C (non-contiguous views or unsupported dtypes).
+    """
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with the API's orjson options."""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Datetimes and NumPy arrays are serialized natively in C and ObjectIds
+    are stringified, so routes can return Mongo documents without a
+    Python-level conversion pass. Returning this class directly from a
+    route also skips FastAPI's ``jsonable_encoder`` walk.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
@@ -5,12 +5,16 @@ Based on Gemini 3 Colab extraction logic with production enhancements.
 """
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import datetime
 
 
 # --- Sub-Components ---
 
+# Sub-components are read-only once validated; unknown keys are dropped.
+SUB_COMPONENT_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class SpacingItem(BaseModel):
     """
     Represents a spacing pattern for transverse reinforcement.
@@ -18,6 +22,8 @@ class SpacingItem(BaseModel):
     Example: "10@100" means 10 spaces at 100mm spacing.
     Special case: quantity="rest" means remaining length.
     """
+    model_config = SUB_COMPONENT_CONFIG
+
     quantity: str = Field(
         ...,
         description="Number of spaces (e.g., '10') or 'rest' for remaining length"
@@ -44,6 +50,8 @@ class SpacingItem(BaseModel):
 
 class StirrupDimensions(BaseModel):
     """Internal clear dimensions that a stirrup/tie encloses."""
+    model_config = SUB_COMPONENT_CONFIG
+
     span_width_mm: Optional[float] = Field(
         None,
         ge=0.001,
@@ -61,6 +69,8 @@ class TransverseReinforcement(BaseModel):
     Stirrups, ties, and hoops for shear/confinement.
     Includes spacing patterns and geometric dimensions.
     """
+    model_config = SUB_COMPONENT_CONFIG
+
     stirrup_id: Optional[str] = Field(
         None,
         description="Verbatim ID/name from drawing"
@@ -105,6 +115,8 @@ class LongitudinalReinforcement(BaseModel):
     Main flexural/axial reinforcement bars.
     Uses prescriptive placement logic (bar_x_columns, bar_y_matrix).
     """
+    model_config = SUB_COMPONENT_CONFIG
+
     bar_group_id: Optional[str] = Field(
         None,
         description="Identifier if bars are grouped"
@@ -161,6 +173,8 @@ class LongitudinalReinforcement(BaseModel):
 
 class ConcreteSpecs(BaseModel):
     """Concrete material properties."""
+    model_config = SUB_COMPONENT_CONFIG
+
     concrete_strength: str = Field(
         ...,
         description="Concrete strength (e.g., 'f\\'c=280kg/cm2')"
@@ -178,6 +192,8 @@ class ConcreteSpecs(BaseModel):
 
 class Geometry(BaseModel):
     """Cross-section geometric properties."""
+    model_config = SUB_COMPONENT_CONFIG
+
     cross_section_type: Literal[
         "rectangular",
         "circular",
@@ -216,6 +232,8 @@ class Geometry(BaseModel):
 
 class ElementIdentification(BaseModel):
     """Element identification and metadata."""
+    model_config = SUB_COMPONENT_CONFIG
+
     type_of_element: str = Field(
         ...,
         description="Element type (e.g., 'Column', 'Beam')"
@@ -240,6 +258,8 @@ class ElementIdentification(BaseModel):
 
 class ReinforcementLayout(BaseModel):
     """High-level reinforcement layout summary."""
+    model_config = SUB_COMPONENT_CONFIG
+
     total_vertical_bars: Optional[int] = Field(
         None,
         ge=0,
@@ -291,9 +311,8 @@ class ColumnExtraction(BaseModel):
         description="Human validator notes"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "element_identification": {
                     "type_of_element": "Column",
@@ -338,3 +357,4 @@ class ColumnExtraction(BaseModel):
                 }
             }
         }
+    )
@@ -9,8 +9,9 @@ Implements mandatory defaults for:
 - Bar spacing validation
 """
 
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-from enum import Enum
+from enum import Enum, IntEnum
 from pydantic import BaseModel, Field
 
 
@@ -36,11 +37,19 @@ class ExposureCondition(str, Enum):
     INTERIOR_BEAMS_COLUMNS = "interior_beams_columns"
 
 
-class HookType(str, Enum):
-    """Standard hook configurations."""
-    STANDARD_90 = "90_degree"
-    STANDARD_180 = "180_degree"
-    SEISMIC_135 = "135_degree_seismic"
+class HookType(IntEnum):
+    """Standard hook configurations (values index _HOOK_EXTENSIONS)."""
+    STANDARD_90 = 0
+    STANDARD_180 = 1
+    SEISMIC_135 = 2
+
+
+# ACI 318-19 Section 25.3.1 hook extension per hook type, as a function of db
+_HOOK_EXTENSIONS = (
+    lambda db: 12 * db,            # 90°: 12db
+    lambda db: max(4 * db, 63.5),  # 180°: max(4db, 2.5")
+    lambda db: max(6 * db, 76.2),  # 135° seismic: max(6db, 3.0")
+)
 
 
 class ACIDefaults(BaseModel):
@@ -59,17 +68,18 @@ class ACIValidator:
     """
 
     # ACI 318-19 Table 20.6.1.3.1 - Minimum Cover (mm)
-    COVER_REQUIREMENTS: Dict[ExposureCondition, Dict[str, float]] = {
-        ExposureCondition.CAST_AGAINST_EARTH: {"all": 76.2},  # 3.0"
-        ExposureCondition.WEATHER_EXPOSED: {
-            "large": 50.8,  # 2.0" for #6-#18
-            "small": 38.1   # 1.5" for #3-#5
-        },
-        ExposureCondition.INTERIOR_BEAMS_COLUMNS: {"all": 38.1},  # 1.5"
-        ExposureCondition.INTERIOR_SLABS: {"all": 19.1},  # 0.75"
+    # (small bars #3-#5, large bars #6-#18), indexed by bar_diameter >= 19.1
+    COVER_REQUIREMENTS: Dict[ExposureCondition, Tuple[float, float]] = {
+        ExposureCondition.CAST_AGAINST_EARTH: (76.2, 76.2),  # 3.0"
+        ExposureCondition.WEATHER_EXPOSED: (38.1, 50.8),  # 1.5" / 2.0"
+        ExposureCondition.INTERIOR_BEAMS_COLUMNS: (38.1, 38.1),  # 1.5"
+        ExposureCondition.INTERIOR_SLABS: (19.1, 19.1),  # 0.75"
     }
 
+    # The calculators below are pure functions of a handful of standard bar
+    # sizes and options, so results are memoized per argument combination.
     @staticmethod
+    @lru_cache(maxsize=256)
     def calculate_hook_extension(
         bar_diameter_mm: float,
         hook_type: HookType = HookType.STANDARD_90
@@ -83,24 +93,15 @@ class ACIValidator:
 
         Returns:
             Extension length in millimeters
-        """
-        db = bar_diameter_mm
-
-        if hook_type == HookType.STANDARD_90:
-            # Extension = 12db for all sizes
-            return 12 * db
-
-        elif hook_type == HookType.STANDARD_180:
-            # Extension = max(4db, 2.5")
-            return max(4 * db, 63.5)  # 2.5" = 63.5mm
-
-        elif hook_type == HookType.SEISMIC_135:
-            # Extension = max(6db, 3.0")
-            return max(6 * db, 76.2)  # 3.0" = 76.2mm
 
-        return 12 * db  # Default fallback
+        Raises:
+            ValueError: If hook_type is not a HookType value
+        """
+        # Coerce first: a raw negative int would otherwise index from the end
+        return _HOOK_EXTENSIONS[HookType(hook_type)](bar_diameter_mm)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calculate_bend_diameter(
         bar_diameter_mm: float,
         hook_type: HookType = HookType.STANDARD_90
@@ -128,6 +129,7 @@ class ACIValidator:
         return bend_factor * db
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_minimum_cover(
         bar_diameter_mm: float,
         exposure: ExposureCondition = ExposureCondition.INTERIOR_BEAMS_COLUMNS
@@ -142,16 +144,8 @@ class ACIValidator:
         Returns:
             Minimum cover in millimeters
         """
-        requirements = ACIValidator.COVER_REQUIREMENTS[exposure]
-
-        if "all" in requirements:
-            return requirements["all"]
-
-        # Weather-exposed case: check bar size
-        if bar_diameter_mm >= 19.1:  # #6 and larger
-            return requirements["large"]
-        else:  # #3-#5
-            return requirements["small"]
+        # #6 and larger take the second (large bar) entry
+        return ACIValidator.COVER_REQUIREMENTS[exposure][bar_diameter_mm >= 19.1]
 
     @staticmethod
     def calculate_minimum_spacing(
@@ -229,75 +223,106 @@ class ACIValidator:
 
         return True, None
 
+    @staticmethod
+    def get_defaults_for(
+        bar: dict,
+        exposure: ExposureCondition = ExposureCondition.INTERIOR_BEAMS_COLUMNS
+    ) -> Optional[ACIDefaults]:
+        """
+        Compute the ACI 318 defaults for one longitudinal bar on demand.
+
+        Args:
+            bar: Longitudinal reinforcement entry from an extraction
+            exposure: Exposure condition for cover calculation
+
+        Returns:
+            ACIDefaults for the bar, or None if its diameter is unknown
+        """
+        bar_dia = bar.get("bar_diameter_mm")
+        if not bar_dia:
+            return None
+
+        return ACIDefaults(
+            hook_extension_mm=ACIValidator.calculate_hook_extension(bar_dia),
+            bend_diameter_mm=ACIValidator.calculate_bend_diameter(bar_dia),
+            min_cover_mm=ACIValidator.get_minimum_cover(bar_dia, exposure),
+            min_spacing_mm=ACIValidator.calculate_minimum_spacing(bar_dia)
+        )
+
     @staticmethod
     def heal_extraction(
         extraction_data: dict,
-        exposure: ExposureCondition = ExposureCondition.INTERIOR_BEAMS_COLUMNS
+        exposure: ExposureCondition = ExposureCondition.INTERIOR_BEAMS_COLUMNS,
+        compute_defaults: bool = False
     ) -> Tuple[dict, List[str]]:
         """
         Auto-heal incomplete extraction by injecting ACI 318 defaults.
 
+        The extraction is healed in place: defaults are written into
+        ``extraction_data`` and its nested dicts, and the same object is
+        returned. Callers that need the original must pass a copy.
+
         Args:
-            extraction_data: Raw extraction from Gemini
+            extraction_data: Raw extraction from Gemini (mutated)
             exposure: Exposure condition for cover calculation
+            compute_defaults: Annotate every bar with ``_aci_defaults``
+                (hook extension and bend diameter). Off by default; use
+                get_defaults_for() to compute them for a single bar.
 
         Returns:
             Tuple of (healed_data, list_of_corrections_applied)
         """
         corrections: List[str] = []
-        healed = extraction_data.copy()
+        healed = extraction_data
+
+        # Shared lookups: cover and bar-fit checks both key off the first bar
+        concrete_specs = healed.get("concrete_specifications")
+        long_bars = healed.get("longitudinal_reinforcement") or []
+        first_bar = long_bars[0] if long_bars else None
+        first_dia = first_bar.get("bar_diameter_mm") if first_bar else None
 
         # 1. Inject default cover if missing
-        if healed.get("concrete_specifications"):
-            concrete_specs = healed["concrete_specifications"]
-
-            if concrete_specs.get("clear_cover_mm") is None:
-                # Get first longitudinal bar diameter for cover calc
-                long_bars = healed.get("longitudinal_reinforcement", [])
-                if long_bars and long_bars[0].get("bar_diameter_mm"):
-                    bar_dia = long_bars[0]["bar_diameter_mm"]
-                    default_cover = ACIValidator.get_minimum_cover(bar_dia, exposure)
-                    concrete_specs["clear_cover_mm"] = default_cover
+        if concrete_specs and concrete_specs.get("clear_cover_mm") is None and first_dia:
+            default_cover = ACIValidator.get_minimum_cover(first_dia, exposure)
+            concrete_specs["clear_cover_mm"] = default_cover
+            corrections.append(
+                f"Injected clear_cover_mm={default_cover:.1f}mm "
+                f"per ACI 318 {exposure.value}"
+            )
+
+        # 2. Annotate longitudinal reinforcement with hook defaults (opt-in)
+        if compute_defaults:
+            for idx, long_bar in enumerate(long_bars):
+                bar_dia = long_bar.get("bar_diameter_mm")
+
+                if bar_dia:
+                    # Calculate hook defaults (for future use)
+                    hook_ext = ACIValidator.calculate_hook_extension(bar_dia)
+                    bend_dia = ACIValidator.calculate_bend_diameter(bar_dia)
+
+                    # Store for potential future use
+                    long_bar["_aci_defaults"] = {
+                        "hook_extension_mm": hook_ext,
+                        "bend_diameter_mm": bend_dia
+                    }
                     corrections.append(
-                        f"Injected clear_cover_mm={default_cover:.1f}mm "
-                        f"per ACI 318 {exposure.value}"
+                        f"Bar {idx}: Calculated ACI defaults "
+                        f"(hook={hook_ext:.1f}mm, bend_dia={bend_dia:.1f}mm)"
                     )
 
-        # 2. Process longitudinal reinforcement
-        for idx, long_bar in enumerate(healed.get("longitudinal_reinforcement", [])):
-            bar_dia = long_bar.get("bar_diameter_mm")
-
-            if bar_dia:
-                # Calculate hook defaults (for future use)
-                hook_ext = ACIValidator.calculate_hook_extension(bar_dia)
-                bend_dia = ACIValidator.calculate_bend_diameter(bar_dia)
-
-                # Store for potential future use
-                long_bar["_aci_defaults"] = {
-                    "hook_extension_mm": hook_ext,
-                    "bend_diameter_mm": bend_dia
-                }
-                corrections.append(
-                    f"Bar {idx}: Calculated ACI defaults "
-                    f"(hook={hook_ext:.1f}mm, bend_dia={bend_dia:.1f}mm)"
-                )
-
         # 3. Validate bar fit
-        geometry = healed.get("geometry", {})
-        concrete_specs = healed.get("concrete_specifications", {})
-        long_bars = healed.get("longitudinal_reinforcement", [])
+        geometry = healed.get("geometry")
 
-        if geometry and concrete_specs and long_bars:
+        if geometry and concrete_specs and first_dia:
             width = geometry.get("width_mm")
             depth = geometry.get("depth_mm")
             cover = concrete_specs.get("clear_cover_mm")
 
-            if width and depth and cover and long_bars[0].get("bar_diameter_mm"):
-                first_bar = long_bars[0]
+            if width and depth and cover:
                 is_valid, error = ACIValidator.validate_bar_fit(
                     section_width_mm=width,
                     section_depth_mm=depth,
-                    bar_diameter_mm=first_bar["bar_diameter_mm"],
+                    bar_diameter_mm=first_dia,
                     bar_count=first_bar["bar_count"],
                     bar_x_columns=first_bar["bar_x_columns"],
                     bar_y_matrix=first_bar["bar_y_matrix"],
@@ -4,15 +4,33 @@ Gemini 3 extraction service.
 Handles AI-powered data extraction from construction drawings.
 """
 
+import asyncio
+import logging
+import time
+import httpx
 from google import genai
-from google.genai import types
-from typing import Optional
+from google.genai import errors, types
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 from ..core.config import settings
 from ..models.schemas import ColumnExtraction
 
 
+logger = logging.getLogger(__name__)
+
+# Rate-limit and transient server errors worth retrying with backoff
+RETRYABLE_STATUS_CODES = [408, 429, 500, 502, 503, 504]
+
+# Errors from caches.create that mean caching is unavailable for this
+# model/prompt (e.g. below the minimum cacheable token count)
+CACHE_UNSUPPORTED_STATUS_CODES = (400, 403, 404)
+
+# Recreate the prompt cache this long before its TTL runs out, and wait
+# this long before retrying after a transient creation failure
+CACHE_REFRESH_MARGIN_SECONDS = 300
+CACHE_RETRY_SECONDS = 60
+
 # System prompt from Colab (Cell 4)
 SYSTEM_PROMPT = """
 Role: You are a precise structural extractor and expert construction estimator, specializing in converting drawing graphics into geometric input data for 3D modeling.
@@ -38,15 +56,39 @@ D. **Required Fields:** Ensure 'bar_count', 'reference_code', 'stirrup_type', an
 class GeminiExtractor:
     """Gemini 3 extraction service."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    # genai.Client per (api_key, http_client), shared across instances so
+    # connection pools and auth state are reused
+    _client_cache: Dict[Tuple[str, Optional[httpx.AsyncClient]], genai.Client] = {}
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Gemini client.
 
         Args:
             api_key: Google API key (defaults to settings)
+            http_client: Shared async HTTP client; keeps connections to
+                Gemini alive across requests. Owned by the caller.
         """
         self.api_key = api_key or settings.GOOGLE_API_KEY
-        self.client = genai.Client(api_key=self.api_key)
+        self._client_key = (self.api_key, http_client)
+
+        client = self._client_cache.get(self._client_key)
+        if client is None:
+            http_options = types.HttpOptions(
+                httpx_async_client=http_client,
+                retry_options=types.HttpRetryOptions(
+                    attempts=settings.GEMINI_RETRY_ATTEMPTS,
+                    http_status_codes=RETRYABLE_STATUS_CODES
+                )
+            )
+            client = genai.Client(api_key=self.api_key, http_options=http_options)
+            self._client_cache[self._client_key] = client
+
+        self.client = client
         self.async_client = self.client.aio
 
         self.thinking_config = types.ThinkingConfig(
@@ -54,6 +96,58 @@ class GeminiExtractor:
             thinking_level=settings.GEMINI_THINKING_LEVEL
         )
 
+        # Opt-in context cache holding SYSTEM_PROMPT, created on first use
+        self._prompt_cache_enabled = settings.GEMINI_CACHE_TTL_SECONDS > 0
+        self._prompt_cache_name: Optional[str] = None
+        self._prompt_cache_refresh_at = 0.0
+        self._prompt_cache_lock = asyncio.Lock()
+
+    async def _get_prompt_cache(self) -> Optional[str]:
+        """
+        Return the name of the context cache holding SYSTEM_PROMPT.
+
+        The cache is created on first use and recreated shortly before its
+        TTL expires. Returns None when caching is disabled (the default,
+        GEMINI_CACHE_TTL_SECONDS=0) or the API rejects it, in which case the
+        prompt is sent inline.
+        """
+        if not self._prompt_cache_enabled:
+            return None
+        if time.monotonic() < self._prompt_cache_refresh_at:
+            return self._prompt_cache_name
+
+        async with self._prompt_cache_lock:
+            # Another request may have refreshed it while we waited
+            if not self._prompt_cache_enabled:
+                return None
+            if time.monotonic() < self._prompt_cache_refresh_at:
+                return self._prompt_cache_name
+
+            ttl = settings.GEMINI_CACHE_TTL_SECONDS
+            try:
+                cache = await self.async_client.caches.create(
+                    model=settings.GEMINI_MODEL,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=SYSTEM_PROMPT,
+                        ttl=f"{ttl}s"
+                    )
+                )
+            except (errors.APIError, httpx.HTTPError) as e:
+                if getattr(e, "code", None) in CACHE_UNSUPPORTED_STATUS_CODES:
+                    logger.warning("Prompt caching unavailable, sending prompt inline: %s", e)
+                    self._prompt_cache_enabled = False
+                else:
+                    logger.warning("Prompt cache creation failed, will retry: %s", e)
+                self._prompt_cache_name = None
+                self._prompt_cache_refresh_at = time.monotonic() + CACHE_RETRY_SECONDS
+                return None
+
+            self._prompt_cache_name = cache.name
+            self._prompt_cache_refresh_at = time.monotonic() + max(
+                ttl - CACHE_REFRESH_MARGIN_SECONDS, ttl / 2
+            )
+            return cache.name
+
     async def extract_from_image(
         self,
         image_bytes: bytes,
@@ -72,16 +166,23 @@ class GeminiExtractor:
         Raises:
             Exception: If extraction fails
         """
-        # Prepare request config
+        # Prepare request config, referencing the cached prompt when available
+        cache_name = await self._get_prompt_cache()
+        prompt = (
+            {"cached_content": cache_name}
+            if cache_name
+            else {"system_instruction": SYSTEM_PROMPT}
+        )
         config = types.GenerateContentConfig(
-            system_instruction=SYSTEM_PROMPT,
+            **prompt,
             response_mime_type="application/json",
             response_schema=ColumnExtraction,
             thinking_config=self.thinking_config
         )
 
-        # Call Gemini API
-        response = await self.async_client.models.generate_content(
+        # Stream the response so chunks are collected while the model is
+        # still generating, instead of waiting for one large final body
+        stream = await self.async_client.models.generate_content_stream(
             model=settings.GEMINI_MODEL,
             contents=[
                 types.Content(
@@ -100,6 +201,59 @@ class GeminiExtractor:
             config=config
         )
 
-        # Parse response
-        # The response.parsed property is automatically a Pydantic object
-        return response.parsed
+        # chunk.text skips thought parts, leaving only the JSON answer
+        text_parts: List[str] = []
+        async for chunk in stream:
+            if chunk.text:
+                text_parts.append(chunk.text)
+
+        if not text_parts:
+            raise ValueError("Gemini returned an empty extraction response")
+
+        # Parse and validate the JSON in a single pass (pydantic-core)
+        return ColumnExtraction.model_validate_json("".join(text_parts))
+
+    async def extract_batch(
+        self,
+        items: List[Tuple[bytes, str]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Union[ColumnExtraction, BaseException]]:
+        """
+        Extract several images concurrently.
+
+        Calls are network-bound, so they are fanned out together while a
+        semaphore keeps at most ``max_concurrency`` requests in flight.
+
+        Args:
+            items: (image_bytes, mime_type) pairs
+            max_concurrency: In-flight request limit (defaults to settings)
+
+        Returns:
+            One result per item, in input order. Failed items hold the
+            raised exception instead of an extraction.
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or settings.GEMINI_MAX_CONCURRENCY
+        )
+
+        async def extract_one(image_bytes: bytes, mime_type: str) -> ColumnExtraction:
+            async with semaphore:
+                return await self.extract_from_image(image_bytes, mime_type)
+
+        return await asyncio.gather(
+            *(extract_one(image_bytes, mime_type) for image_bytes, mime_type in items),
+            return_exceptions=True
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying async Gemini client and drop it from the cache."""
+        if self._prompt_cache_name:
+            try:
+                await self.async_client.caches.delete(name=self._prompt_cache_name)
+            except (errors.APIError, httpx.HTTPError) as e:
+                logger.warning("Failed to delete prompt cache: %s", e)
+            self._prompt_cache_name = None
+
+        if self._client_cache.get(self._client_key) is self.client:
+            del self._client_cache[self._client_key]
+        await self.async_client.aclose()
@@ -7,13 +7,17 @@ without relying on heavy CAD kernels.
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+import orjson
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Union
 from geomdl import NURBS, operations
 from geomdl import exchange
 
 
 class Point3D:
     """Simple 3D point container."""
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -28,6 +32,8 @@ class Point3D:
 
 class LongitudinalBarGeometry:
     """Geometry data for a single longitudinal bar."""
+    __slots__ = ("bar_id", "start_point", "end_point", "diameter_mm")
+
     def __init__(
         self,
         bar_id: int,
@@ -52,10 +58,12 @@ class LongitudinalBarGeometry:
 
 class StirrupGeometry:
     """Geometry data for a stirrup/tie with NURBS curves for bends."""
+    __slots__ = ("stirrup_id", "path_points", "diameter_mm", "shape", "z_position")
+
     def __init__(
         self,
         stirrup_id: str,
-        path_points: List[Point3D],
+        path_points: Union[List[Point3D], np.ndarray],
         diameter_mm: float,
         shape: str,
         z_position: float
@@ -67,9 +75,15 @@ class StirrupGeometry:
         self.z_position = z_position
 
     def to_dict(self) -> Dict:
+        if isinstance(self.path_points, np.ndarray):
+            # (points, 3) array, e.g. from calculate_rectangular_stirrup
+            path = [{"x": x, "y": y, "z": z} for x, y, z in self.path_points.tolist()]
+        else:
+            path = [pt.to_dict() for pt in self.path_points]
+
         return {
             "stirrup_id": self.stirrup_id,
-            "path": [pt.to_dict() for pt in self.path_points],
+            "path": path,
             "diameter_mm": self.diameter_mm,
             "shape": self.shape,
             "z_position": self.z_position,
@@ -77,6 +91,206 @@ class StirrupGeometry:
         }
 
 
+@dataclass
+class LongitudinalBarsSoA:
+    """
+    Struct-of-arrays storage for a group of longitudinal bars.
+
+    One (N, 3) float32 array per end point replaces N bar objects and 2N
+    points.
+    """
+    xyz_start: np.ndarray  # (N, 3)
+    xyz_end: np.ndarray    # (N, 3)
+    diameter: np.ndarray   # (N,)
+
+    def __len__(self) -> int:
+        return len(self.diameter)
+
+    def to_payload(self) -> Dict:
+        """
+        Convert to the flat-array payload consumed by Three.js.
+
+        Coordinates are flattened to [x0, y0, z0, x1, ...] so the frontend
+        can read them with a stride instead of per-point objects. Arrays
+        are serialized natively by orjson.
+        """
+        return {
+            "count": len(self),
+            "stride": 3,
+            "start": self.xyz_start.reshape(-1),
+            "end": self.xyz_end.reshape(-1),
+            "diameter_mm": self.diameter,
+            "type": "longitudinal"
+        }
+
+
+@dataclass
+class StirrupsSoA:
+    """
+    Struct-of-arrays storage for one stirrup group repeated along Z.
+
+    All levels share the diameter and shape; paths are stored as a single
+    (levels, points, 3) float32 array.
+    """
+    id_prefix: str
+    path: np.ndarray        # (levels, points, 3)
+    z_position: np.ndarray  # (levels,)
+    diameter_mm: float
+    shape: str
+
+    def __len__(self) -> int:
+        return len(self.z_position)
+
+    def to_payload(self) -> Dict:
+        """
+        Convert to the flat-array payload consumed by Three.js.
+
+        ``positions`` holds every level's path back to back; level i spans
+        points [i * points_per_path, (i + 1) * points_per_path).
+        """
+        return {
+            "stirrup_id": self.id_prefix,
+            "count": len(self),
+            "points_per_path": self.path.shape[1],
+            "stride": 3,
+            "positions": self.path.reshape(-1),
+            "z_positions": self.z_position,
+            "diameter_mm": self.diameter_mm,
+            "shape": self.shape,
+            "type": "stirrup"
+        }
+
+
+def _longitudinal_bar_xy(
+    width_mm: float,
+    depth_mm: float,
+    bar_diameter_mm: float,
+    bar_x_columns: int,
+    bar_y_matrix: List[int],
+    clear_cover_mm: float
+) -> np.ndarray:
+    """
+    Compute (x, y) centers for every longitudinal bar in one pass.
+
+    Bars are ordered column by column (left to right), bottom to top
+    within each column, matching the bar_y_matrix layout.
+
+    Returns:
+        Array of shape (N, 2) with one row per bar
+    """
+    edge = clear_cover_mm + bar_diameter_mm / 2
+    x_positions = np.linspace(edge, width_mm - edge, bar_x_columns)
+
+    counts = np.asarray(bar_y_matrix, dtype=np.int64)[:, None]
+    max_y = int(counts.max(initial=0))
+    slots = np.arange(max_y)[None, :]
+
+    # One row per column, evaluated like np.linspace(edge, depth - edge, n)
+    # for every column at once; slots past a column's bar count are masked
+    step = ((depth_mm - edge) - edge) / np.maximum(counts - 1, 1)
+    y_matrix = np.where(slots == counts - 1, depth_mm - edge, slots * step + edge)
+    # Single bar: center it
+    y_matrix = np.where(counts == 1, depth_mm / 2, y_matrix)
+
+    x_matrix = np.broadcast_to(x_positions[:len(counts), None], y_matrix.shape)
+    mask = slots < counts
+
+    return np.column_stack((x_matrix[mask], y_matrix[mask]))
+
+
+def _stirrup_z_positions(
+    spacings: np.ndarray,
+    quantities: np.ndarray,
+    total_height_mm: float
+) -> np.ndarray:
+    """
+    Compute stirrup z levels from a spacing pattern held as parallel arrays.
+
+    Args:
+        spacings: Spacing of each pattern item (mm)
+        quantities: Stirrup count of each item, -1 for "rest" (fill the
+            remaining height; ends the pattern)
+        total_height_mm: Column height; levels at or above it are dropped
+
+    Returns:
+        Array of z levels, starting with 0.0 at the bottom
+    """
+    rest_items = np.flatnonzero(quantities < 0)
+    num_fixed = int(rest_items[0]) if rest_items.size else len(quantities)
+
+    # Fixed-count items: one step per stirrup, accumulated from the bottom.
+    # Quantities come from the client, so cap each item at the steps needed
+    # to pass the column top (plus one for rounding); the rest would be
+    # dropped below anyway. Non-positive spacings (rejected by SpacingItem)
+    # are skipped.
+    fixed_spacings = spacings[:num_fixed]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_steps = np.where(
+            fixed_spacings > 0,
+            np.ceil(max(total_height_mm, 0.0) / fixed_spacings) + 1,
+            0
+        )
+    counts = np.minimum(quantities[:num_fixed], max_steps).astype(np.int64)
+    steps = np.repeat(fixed_spacings, counts)
+    fixed = np.cumsum(steps)
+    current_z = float(fixed[-1]) if fixed.size else 0.0
+    levels = [np.zeros(1), fixed[fixed < total_height_mm]]
+
+    if rest_items.size:
+        spacing = spacings[num_fixed]
+        tail = np.arange(current_z + spacing, total_height_mm, spacing)
+        levels.append(tail[tail < total_height_mm])
+
+    return np.concatenate(levels)
+
+
+def _rect_xy_template(internal_width_mm: float, internal_depth_mm: float) -> np.ndarray:
+    """
+    Closed rectangular stirrup outline in the XY plane.
+
+    Returns:
+        Array of shape (5, 2), clockwise from bottom-left with the first
+        point repeated to close the path
+    """
+    half_w = internal_width_mm / 2
+    half_d = internal_depth_mm / 2
+
+    return np.array([
+        [-half_w, -half_d],  # Bottom-left
+        [half_w, -half_d],   # Bottom-right
+        [half_w, half_d],    # Top-right
+        [-half_w, half_d],   # Top-left
+        [-half_w, -half_d],  # Close path
+    ])
+
+
+def _rect_stirrup_paths(
+    internal_width_mm: float,
+    internal_depth_mm: float,
+    z_positions: List[float],
+    dtype: type = np.float32
+) -> np.ndarray:
+    """
+    Broadcast one rectangular outline across every stirrup level.
+
+    Args:
+        internal_width_mm: Internal clear width
+        internal_depth_mm: Internal clear depth
+        z_positions: Z-coordinate of each level
+        dtype: Output dtype; float32 for the /geometry payload, float64
+            where coordinates are serialized as Python floats
+
+    Returns:
+        Array of shape (levels, 5, 3)
+    """
+    z = np.asarray(z_positions, dtype=dtype)
+    paths = np.empty((len(z), 5, 3), dtype=dtype)
+    paths[..., :2] = _rect_xy_template(internal_width_mm, internal_depth_mm)
+    paths[..., 2] = z[:, None]
+
+    return paths
+
+
 class GeometryCalculator:
     """
     Calculates 3D geometry for reinforcement using NumPy and geomdl.
@@ -103,7 +317,7 @@ class GeometryCalculator:
         bar_x_columns: int,
         bar_y_matrix: List[int],
         clear_cover_mm: float
-    ) -> List[LongitudinalBarGeometry]:
+    ) -> LongitudinalBarsSoA:
         """
         Calculate coordinates for all longitudinal bars.
 
@@ -119,52 +333,25 @@ class GeometryCalculator:
             clear_cover_mm: Concrete cover
 
         Returns:
-            List of longitudinal bar geometries
+            Struct-of-arrays geometry for the bar group
         """
-        bars: List[LongitudinalBarGeometry] = []
-
-        # Calculate X positions (columns)
-        x_positions = np.linspace(
-            clear_cover_mm + bar_diameter_mm / 2,
-            width_mm - clear_cover_mm - bar_diameter_mm / 2,
-            bar_x_columns
+        bar_xy = _longitudinal_bar_xy(
+            width_mm, depth_mm, bar_diameter_mm,
+            bar_x_columns, bar_y_matrix, clear_cover_mm
+        )
+        num_bars = len(bar_xy)
+
+        # float32 matches the Float32Array buffers used by Three.js
+        xyz_start = np.zeros((num_bars, 3), dtype=np.float32)
+        xyz_start[:, :2] = bar_xy
+        xyz_end = xyz_start.copy()
+        xyz_end[:, 2] = self.column_height_mm
+
+        return LongitudinalBarsSoA(
+            xyz_start=xyz_start,
+            xyz_end=xyz_end,
+            diameter=np.full(num_bars, bar_diameter_mm, dtype=np.float32)
         )
-
-        bar_id = 0
-
-        for col_index, num_bars_in_col in enumerate(bar_y_matrix):
-            if num_bars_in_col == 0:
-                continue
-
-            # Calculate Y positions for this column
-            if num_bars_in_col > 1:
-                y_coords = np.linspace(
-                    clear_cover_mm + bar_diameter_mm / 2,
-                    depth_mm - clear_cover_mm - bar_diameter_mm / 2,
-                    num_bars_in_col
-                )
-            else:
-                # Single bar: center it
-                y_coords = np.array([depth_mm / 2])
-
-            current_x = x_positions[col_index]
-
-            # Create bar geometries
-            for y_coord in y_coords:
-                start = Point3D(x=current_x, y=y_coord, z=0)
-                end = Point3D(x=current_x, y=y_coord, z=self.column_height_mm)
-
-                bars.append(
-                    LongitudinalBarGeometry(
-                        bar_id=bar_id,
-                        start_point=start,
-                        end_point=end,
-                        diameter_mm=bar_diameter_mm
-                    )
-                )
-                bar_id += 1
-
-        return bars
 
     def calculate_rectangular_stirrup(
         self,
@@ -173,7 +360,7 @@ class GeometryCalculator:
         bar_diameter_mm: float,
         z_position: float,
         bend_radius_mm: Optional[float] = None
-    ) -> List[Point3D]:
+    ) -> np.ndarray:
         """
         Calculate path points for a rectangular stirrup with filleted corners.
 
@@ -185,28 +372,18 @@ class GeometryCalculator:
             bend_radius_mm: Inside bend radius (default: 3 * bar_diameter)
 
         Returns:
-            List of path points forming the stirrup perimeter
+            Float64 array of shape (5, 3): the closed perimeter, clockwise
+            from bottom-left
         """
         if bend_radius_mm is None:
             bend_radius_mm = 3 * bar_diameter_mm  # ACI minimum
 
-        # Define corners (before fillet)
-        # We'll create a simple rectangle for MVP
+        # Simple rectangle for MVP
         # Future enhancement: Use geomdl to create exact NURBS arcs at corners
-
-        half_w = internal_width_mm / 2
-        half_d = internal_depth_mm / 2
-
-        # Rectangular path (clockwise from bottom-left)
-        points = [
-            Point3D(-half_w, -half_d, z_position),  # Bottom-left
-            Point3D(half_w, -half_d, z_position),   # Bottom-right
-            Point3D(half_w, half_d, z_position),    # Top-right
-            Point3D(-half_w, half_d, z_position),   # Top-left
-            Point3D(-half_w, -half_d, z_position),  # Close path
-        ]
-
-        return points
+        # float64 so StirrupGeometry.to_dict() emits the same values as Point3D
+        return _rect_stirrup_paths(
+            internal_width_mm, internal_depth_mm, [z_position], dtype=np.float64
+        )[0]
 
     def calculate_stirrup_spacing_positions(
         self,
@@ -226,28 +403,18 @@ class GeometryCalculator:
         if total_height_mm is None:
             total_height_mm = self.column_height_mm
 
-        z_positions: List[float] = [0.0]  # Start at bottom
-        current_z = 0.0
-
-        for item in spacing_pattern:
-            quantity = item["quantity"]
-            spacing = item["spacing"]
-
-            if quantity == "rest":
-                # Fill remaining height
-                while current_z + spacing < total_height_mm:
-                    current_z += spacing
-                    z_positions.append(current_z)
-                break
-            else:
-                # Add specified number of spacings
-                for _ in range(int(quantity)):
-                    current_z += spacing
-                    if current_z >= total_height_mm:
-                        break
-                    z_positions.append(current_z)
-
-        return z_positions
+        spacings = np.array(
+            [item["spacing"] for item in spacing_pattern], dtype=np.float64
+        )
+        quantities = np.array(
+            [
+                -1 if item["quantity"] == "rest" else max(int(item["quantity"]), 0)
+                for item in spacing_pattern
+            ],
+            dtype=np.int64
+        )
+
+        return _stirrup_z_positions(spacings, quantities, total_height_mm).tolist()
 
     def generate_complete_geometry(
         self,
@@ -262,7 +429,8 @@ class GeometryCalculator:
             extraction_data: Validated extraction data (ColumnExtraction)
 
         Returns:
-            Dictionary containing all geometry ready for Three.js
+            Dictionary containing all geometry ready for Three.js, with bar
+            and stirrup groups as flat float32 coordinate arrays
         """
         try:
             # Defensive checks for None values
@@ -280,13 +448,16 @@ class GeometryCalculator:
             trans_reinforcement = [item for item in trans_reinforcement if item is not None]
             long_reinforcement = [item for item in long_reinforcement if item is not None]
         except Exception as e:
-            import json
             print(f"\n{'='*80}")
             print(f"ERROR in generate_complete_geometry:")
             print(f"Exception: {type(e).__name__}: {str(e)}")
             print(f"extraction_data type: {type(extraction_data)}")
             print(f"extraction_data content:")
-            print(json.dumps(extraction_data, indent=2, default=str))
+            print(orjson.dumps(
+                extraction_data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode())
             print(f"{'='*80}\n")
             raise
 
@@ -316,7 +487,7 @@ class GeometryCalculator:
                 bar_y_matrix=long_bar_group["bar_y_matrix"],
                 clear_cover_mm=cover
             )
-            result["longitudinal_bars"].extend([bar.to_dict() for bar in bars])
+            result["longitudinal_bars"].append(bars.to_payload())
 
         # 2. Generate stirrups
         for stirrup_data in trans_reinforcement:
@@ -337,22 +508,16 @@ class GeometryCalculator:
 
                 # Generate stirrup at each Z position
                 stirrup_diameter = stirrup_data.get("bar_diameter_mm") or 12.7  # Default to 1/2 inch
-                for idx, z_pos in enumerate(z_positions):
-                    path_points = self.calculate_rectangular_stirrup(
-                        internal_width_mm=internal_w,
-                        internal_depth_mm=internal_d,
-                        bar_diameter_mm=stirrup_diameter,
-                        z_position=z_pos
-                    )
-
-                    stirrup = StirrupGeometry(
-                        stirrup_id=f"{stirrup_data.get('stirrup_id', 'stirrup')}_{idx}",
-                        path_points=path_points,
-                        diameter_mm=stirrup_diameter,
-                        shape=stirrup_data["stirrup_shape"],
-                        z_position=z_pos
-                    )
-                    result["stirrups"].append(stirrup.to_dict())
+                paths = _rect_stirrup_paths(internal_w, internal_d, z_positions)
+
+                stirrups = StirrupsSoA(
+                    id_prefix=str(stirrup_data.get("stirrup_id", "stirrup")),
+                    path=paths,
+                    z_position=np.asarray(z_positions, dtype=np.float32),
+                    diameter_mm=stirrup_diameter,
+                    shape=stirrup_data["stirrup_shape"]
+                )
+                result["stirrups"].append(stirrups.to_payload())
 
         return result
 
@@ -0,0 +1,151 @@
+# File: backend/tests/conftest.py
+"""
+Shared pytest fixtures.
+
+Settings require GOOGLE_API_KEY at import time, so a placeholder is set
+before the app is imported. Tests never reach Gemini or MongoDB.
+"""
+
+import copy
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pytest
+from bson import ObjectId
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from main import app  # noqa: E402
+from src.core.database import database  # noqa: E402
+
+
+def _get_path(document: dict, key: str) -> Any:
+    value: Any = document
+    for part in key.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def _matches(document: dict, query: dict) -> bool:
+    """Evaluate the subset of MongoDB query syntax used by the routes."""
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(document, clause) for clause in condition):
+                return False
+            continue
+
+        value = _get_path(document, key)
+        if isinstance(condition, dict):
+            for operator, operand in condition.items():
+                if operator == "$lt" and not (value is not None and value < operand):
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _project(document: dict, projection: Optional[dict]) -> dict:
+    if not projection:
+        return copy.deepcopy(document)
+
+    projected = {"_id": document["_id"]}
+    for key in projection:
+        *parents, leaf = key.split(".")
+        source, target = document, projected
+        for part in parents:
+            source = source.get(part) if isinstance(source, dict) else None
+            target = target.setdefault(part, {})
+        if isinstance(source, dict) and leaf in source:
+            target[leaf] = copy.deepcopy(source[leaf])
+    return projected
+
+
+def _to_bson_precision(value: Any) -> Any:
+    """BSON datetimes keep milliseconds only."""
+    if isinstance(value, datetime):
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    return value
+
+
+class FakeCursor:
+    """In-memory stand-in for a Motor cursor."""
+
+    def __init__(self, documents: List[dict]):
+        self._documents = documents
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, keys: List[tuple]) -> "FakeCursor":
+        for key, direction in reversed(keys):
+            self._documents.sort(key=lambda doc: _get_path(doc, key), reverse=direction == -1)
+        return self
+
+    def skip(self, count: int) -> "FakeCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "FakeCursor":
+        self._limit = count
+        return self
+
+    def _results(self) -> List[dict]:
+        results = self._documents[self._skip:]
+        return results[:self._limit] if self._limit else results
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]:
+        return self._results()
+
+    def __aiter__(self):
+        self._iterator = iter(self._results())
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeInsertManyResult:
+    def __init__(self, inserted_ids: List[ObjectId]):
+        self.inserted_ids = inserted_ids
+
+
+class FakeCollection:
+    """In-memory stand-in for the Motor extractions collection."""
+
+    def __init__(self):
+        self.documents: List[Dict[str, Any]] = []
+
+    def find(self, query: Optional[dict] = None, projection: Optional[dict] = None) -> FakeCursor:
+        return FakeCursor([
+            _project(document, projection)
+            for document in self.documents
+            if _matches(document, query or {})
+        ])
+
+    async def insert_many(self, documents: List[dict], ordered: bool = True) -> FakeInsertManyResult:
+        inserted_ids = []
+        for document in documents:
+            stored = {key: _to_bson_precision(value) for key, value in document.items()}
+            stored.setdefault("_id", ObjectId())
+            self.documents.append(stored)
+            inserted_ids.append(stored["_id"])
+        return FakeInsertManyResult(inserted_ids)
+
+
+@pytest.fixture
+def extractions(monkeypatch) -> FakeCollection:
+    """Route database access to an in-memory extractions collection."""
+    collection = FakeCollection()
+    monkeypatch.setattr(database, "get_collection", lambda name: collection)
+    return collection
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """API client without lifespan events (no MongoDB connection)."""
+    return TestClient(app)
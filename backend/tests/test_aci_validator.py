@@ -0,0 +1,26 @@
+# File: backend/tests/test_aci_validator.py
+"""ACI 318-19 hook extension lookup."""
+
+import pytest
+
+from src.services.aci_validator import ACIValidator, HookType
+
+
+@pytest.mark.parametrize("hook_type, expected", [
+    (HookType.STANDARD_90, 12 * 15.875),
+    (HookType.STANDARD_180, 63.5),
+    (HookType.SEISMIC_135, 6 * 15.875),
+    (2, 6 * 15.875),
+])
+def test_hook_extension_per_type(hook_type, expected):
+    assert ACIValidator.calculate_hook_extension(15.875, hook_type) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("hook_type", [-1, 3, "90_degree"])
+def test_invalid_hook_type_is_rejected(hook_type):
+    with pytest.raises(ValueError):
+        ACIValidator.calculate_hook_extension(15.875, hook_type)
+
+    # Still rejected on a repeat call, i.e. nothing was memoized
+    with pytest.raises(ValueError):
+        ACIValidator.calculate_hook_extension(15.875, hook_type)
@@ -0,0 +1,92 @@
+# File: backend/tests/test_extract_batch.py
+"""POST /extract/batch with a stubbed Gemini extractor."""
+
+import pytest
+
+from main import app
+from src.api import routes
+from src.api.dependencies import get_gemini_extractor
+from src.core.config import settings
+from src.models.schemas import ColumnExtraction
+
+BATCH_URL = "/api/v1/extract/batch"
+EXAMPLE = ColumnExtraction.model_config["json_schema_extra"]["example"]
+
+
+class StubExtractor:
+    """Returns the schema example for every image, or an error for b"fail"."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def extract_batch(self, items):
+        self.batches.append(items)
+        return [
+            RuntimeError("model refused") if image_bytes == b"fail"
+            else ColumnExtraction.model_validate(EXAMPLE)
+            for image_bytes, _ in items
+        ]
+
+
+@pytest.fixture
+def extractor():
+    stub = StubExtractor()
+    app.dependency_overrides[get_gemini_extractor] = lambda: stub
+    yield stub
+    app.dependency_overrides.pop(get_gemini_extractor, None)
+
+
+def upload(*contents: bytes) -> list:
+    return [("files", (f"c{i}.png", data, "image/png")) for i, data in enumerate(contents)]
+
+
+def test_results_follow_upload_order(client, extractor):
+    response = client.post(BATCH_URL, files=upload(b"a", b"fail", b"c"))
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["filename"] for r in results] == ["c0.png", "c1.png", "c2.png"]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["error"] == "Extraction failed: model refused"
+
+
+def test_healing_failure_only_fails_its_file(client, extractor, monkeypatch):
+    heal = routes.heal_extraction_cached
+    calls = []
+
+    def flaky_heal(extraction_data, exposure):
+        calls.append(exposure)
+        if len(calls) == 2:
+            raise ValueError("bad bar matrix")
+        return heal(extraction_data, exposure)
+
+    monkeypatch.setattr(routes, "heal_extraction_cached", flaky_heal)
+
+    response = client.post(BATCH_URL, files=upload(b"a", b"b", b"c"))
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["error"] == "Validation failed: bad bar matrix"
+    assert results[2]["data"]["element_identification"]["element_id"] == "C-02"
+
+
+def test_combined_size_is_capped(client, extractor, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_BATCH_UPLOAD_SIZE_MB", 1)
+    half = b"x" * (512 * 1024 + 1)
+
+    response = client.post(BATCH_URL, files=upload(half, half))
+
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Batch exceeds 1MB upload limit"
+    assert extractor.batches == []
+
+
+def test_batch_within_cap_is_extracted(client, extractor, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_BATCH_UPLOAD_SIZE_MB", 1)
+    half = b"x" * (512 * 1024)
+
+    response = client.post(BATCH_URL, files=upload(half, half))
+
+    assert response.status_code == 200
+    assert [len(image_bytes) for image_bytes, _ in extractor.batches[0]] == [len(half)] * 2
@@ -0,0 +1,238 @@
+# File: backend/tests/test_geometry.py
+"""
+Regression tests for the vectorized geometry kernels and /geometry payload.
+
+The reference functions are the original per-column / per-stirrup loops;
+the kernels must reproduce them (to rounding) for randomly generated
+layouts.
+"""
+
+import copy
+import random
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from src.models.schemas import ColumnExtraction
+from src.services.geometry_calculator import (
+    GeometryCalculator,
+    Point3D,
+    StirrupGeometry,
+    _longitudinal_bar_xy,
+    _stirrup_z_positions,
+)
+
+GEOMETRY_URL = "/api/v1/geometry"
+EXAMPLE = ColumnExtraction.model_config["json_schema_extra"]["example"]
+RANDOM_LAYOUTS = 3000
+
+
+def reference_bar_xy(
+    width_mm: float,
+    depth_mm: float,
+    bar_diameter_mm: float,
+    bar_x_columns: int,
+    bar_y_matrix: List[int],
+    clear_cover_mm: float
+) -> np.ndarray:
+    """Per-column np.linspace loop the vectorized kernel replaced."""
+    x_positions = np.linspace(
+        clear_cover_mm + bar_diameter_mm / 2,
+        width_mm - clear_cover_mm - bar_diameter_mm / 2,
+        bar_x_columns
+    )
+
+    rows = []
+    for col_index, num_bars_in_col in enumerate(bar_y_matrix):
+        if num_bars_in_col == 0:
+            continue
+        if num_bars_in_col > 1:
+            y_coords = np.linspace(
+                clear_cover_mm + bar_diameter_mm / 2,
+                depth_mm - clear_cover_mm - bar_diameter_mm / 2,
+                num_bars_in_col
+            )
+        else:
+            y_coords = np.array([depth_mm / 2])
+        rows.extend((x_positions[col_index], y) for y in y_coords)
+
+    return np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+
+def reference_z_positions(spacing_pattern: List[Dict], total_height_mm: float) -> List[float]:
+    """Stirrup-by-stirrup accumulation loop the array kernel replaced."""
+    z_positions = [0.0]
+    current_z = 0.0
+
+    for item in spacing_pattern:
+        spacing = item["spacing"]
+        if item["quantity"] == "rest":
+            while current_z + spacing < total_height_mm:
+                current_z += spacing
+                z_positions.append(current_z)
+            break
+        for _ in range(int(item["quantity"])):
+            current_z += spacing
+            if current_z >= total_height_mm:
+                break
+            z_positions.append(current_z)
+
+    return z_positions
+
+
+def random_layout(rng: random.Random) -> Dict:
+    bar_x_columns = rng.randint(1, 6)
+    return {
+        "width_mm": rng.uniform(200, 1200),
+        "depth_mm": rng.uniform(200, 1200),
+        "bar_diameter_mm": rng.choice([9.525, 12.7, 15.875, 19.05, 25.4, 35.8]),
+        "bar_x_columns": bar_x_columns,
+        "bar_y_matrix": [rng.randint(0, 8) for _ in range(rng.randint(1, bar_x_columns))],
+        "clear_cover_mm": rng.uniform(20, 80),
+    }
+
+
+def random_spacing_pattern(rng: random.Random) -> List[Dict]:
+    pattern = []
+    for _ in range(rng.randint(0, 4)):
+        quantity = "rest" if rng.random() < 0.3 else str(rng.randint(0, 40))
+        spacing = rng.choice([25.0, 50.0, 75.0, 100.0, 150.0, 250.0, rng.uniform(1, 500)])
+        pattern.append({"quantity": quantity, "spacing": spacing})
+    return pattern
+
+
+def test_bar_xy_matches_reference_for_random_layouts():
+    rng = random.Random(20251121)
+
+    for _ in range(RANDOM_LAYOUTS):
+        layout = random_layout(rng)
+        expected = reference_bar_xy(**layout)
+        actual = _longitudinal_bar_xy(**layout)
+
+        assert actual.shape == expected.shape, layout
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, err_msg=str(layout))
+
+
+@pytest.mark.parametrize("bar_y_matrix, expected_y", [
+    ([1], [250.0]),
+    ([0, 2], [50.0, 450.0]),
+    ([3, 1], [50.0, 250.0, 450.0, 250.0]),
+])
+def test_bar_xy_small_layouts(bar_y_matrix, expected_y):
+    xy = _longitudinal_bar_xy(300.0, 500.0, 20.0, 2, bar_y_matrix, 40.0)
+
+    np.testing.assert_allclose(xy[:, 1], expected_y)
+    assert set(xy[:, 0]) <= {50.0, 250.0}
+
+
+def test_spacing_positions_match_reference_for_random_patterns():
+    rng = random.Random(7)
+    calculator = GeometryCalculator(column_height_mm=3000.0)
+
+    for _ in range(RANDOM_LAYOUTS):
+        pattern = random_spacing_pattern(rng)
+        height = rng.choice([0.0, 1000.0, 2500.5, 3000.0, 3600.0])
+
+        actual = calculator.calculate_stirrup_spacing_positions(pattern, height)
+
+        assert actual == pytest.approx(reference_z_positions(pattern, height), abs=1e-6), pattern
+
+
+def test_stirrup_z_positions_kernel():
+    spacings = np.array([50.0, 100.0, 250.0])
+    quantities = np.array([1, 7, -1])
+
+    z = _stirrup_z_positions(spacings, quantities, 3000.0)
+
+    assert z.tolist() == pytest.approx(
+        [0.0, 50.0] + [50.0 + 100.0 * i for i in range(1, 8)]
+        + [750.0 + 250.0 * i for i in range(1, 9)]
+    )
+    # "rest" ends the pattern; nothing after it contributes
+    tail = _stirrup_z_positions(np.array([100.0, 10.0]), np.array([-1, 5]), 350.0)
+    assert tail.tolist() == pytest.approx([0.0, 100.0, 200.0, 300.0])
+
+
+def test_rectangular_stirrup_serializes_like_point3d_path():
+    calculator = GeometryCalculator()
+    half_w, half_d, z = 340.3 / 2, 520.7 / 2, 33.3
+    expected_path = [
+        Point3D(-half_w, -half_d, z), Point3D(half_w, -half_d, z), Point3D(half_w, half_d, z),
+        Point3D(-half_w, half_d, z), Point3D(-half_w, -half_d, z),
+    ]
+
+    path = calculator.calculate_rectangular_stirrup(340.3, 520.7, 9.525, z)
+
+    assert path.dtype == np.float64
+    assert (
+        StirrupGeometry("s", path, 9.525, "rectangular", z).to_dict()
+        == StirrupGeometry("s", expected_path, 9.525, "rectangular", z).to_dict()
+    )
+
+
+def test_huge_stirrup_quantity_stops_at_column_top(client):
+    body = copy.deepcopy(EXAMPLE)
+    body["transverse_reinforcement"][0]["spacing_mm"] = [
+        {"quantity": "1000000000000", "spacing": 100.0},
+        {"quantity": "rest", "spacing": 50.0},
+    ]
+
+    response = client.post(GEOMETRY_URL, json=body, params={"column_height_mm": 3000})
+
+    assert response.status_code == 200
+    (stirrups,) = response.json()["geometry"]["stirrups"]
+    assert stirrups["z_positions"] == pytest.approx([100.0 * i for i in range(30)])
+
+
+def test_geometry_payload_wire_format(client):
+    response = client.post(GEOMETRY_URL, json=copy.deepcopy(EXAMPLE), params={"column_height_mm": 2800})
+
+    assert response.status_code == 200
+    geometry = response.json()["geometry"]
+    assert geometry["section"]["height_mm"] == 2800
+
+    group = EXAMPLE["longitudinal_reinforcement"][0]
+    cover = EXAMPLE["concrete_specifications"]["clear_cover_mm"]
+    (bars,) = geometry["longitudinal_bars"]
+    assert set(bars) == {"count", "stride", "start", "end", "diameter_mm", "type"}
+    assert bars["type"] == "longitudinal"
+    assert bars["count"] == group["bar_count"]
+    assert bars["stride"] == 3
+
+    expected_xy = reference_bar_xy(
+        EXAMPLE["geometry"]["width_mm"], EXAMPLE["geometry"]["depth_mm"],
+        group["bar_diameter_mm"], group["bar_x_columns"], group["bar_y_matrix"], cover
+    )
+    start = np.array(bars["start"], dtype=np.float32).reshape(-1, bars["stride"])
+    end = np.array(bars["end"], dtype=np.float32).reshape(-1, bars["stride"])
+    np.testing.assert_allclose(start[:, :2], expected_xy, rtol=1e-6)
+    np.testing.assert_allclose(end[:, :2], expected_xy, rtol=1e-6)
+    assert start[:, 2].tolist() == [0.0] * bars["count"]
+    assert end[:, 2].tolist() == [2800.0] * bars["count"]
+    assert bars["diameter_mm"] == [np.float32(group["bar_diameter_mm"])] * bars["count"]
+
+    stirrup_data = EXAMPLE["transverse_reinforcement"][0]
+    (stirrups,) = geometry["stirrups"]
+    assert set(stirrups) == {
+        "stirrup_id", "count", "points_per_path", "stride", "positions",
+        "z_positions", "diameter_mm", "shape", "type"
+    }
+    assert stirrups["type"] == "stirrup"
+    assert stirrups["shape"] == "rectangular"
+    assert stirrups["diameter_mm"] == stirrup_data["bar_diameter_mm"]
+
+    expected_z = reference_z_positions(stirrup_data["spacing_mm"], 2800.0)
+    assert stirrups["count"] == len(expected_z)
+    assert stirrups["z_positions"] == pytest.approx(expected_z)
+
+    half_w = (EXAMPLE["geometry"]["width_mm"] - 2 * cover) / 2
+    half_d = (EXAMPLE["geometry"]["depth_mm"] - 2 * cover) / 2
+    outline = np.array([
+        [-half_w, -half_d], [half_w, -half_d], [half_w, half_d], [-half_w, half_d], [-half_w, -half_d]
+    ])
+    paths = np.array(stirrups["positions"]).reshape(
+        stirrups["count"], stirrups["points_per_path"], stirrups["stride"]
+    )
+    np.testing.assert_allclose(paths[..., :2], np.broadcast_to(outline, (len(paths), 5, 2)), rtol=1e-6)
+    np.testing.assert_allclose(paths[..., 2], np.array(expected_z)[:, None].repeat(5, axis=1), rtol=1e-6)
@@ -0,0 +1,116 @@
+# File: backend/tests/test_heal_cache.py
+"""Memoized ACI healing used by /extract, /extract/batch and /validate."""
+
+import copy
+
+import pytest
+
+from src.api import routes
+from src.services.aci_validator import ACIValidator
+
+VALIDATE_URL = "/api/v1/validate"
+
+EXTRACTION = {
+    "element_identification": {"element_id": "C-02"},
+    "geometry": {"cross_section_type": "rectangular", "width_mm": 420.0, "depth_mm": 700.0},
+    "concrete_specifications": {"clear_cover_mm": None},
+    "longitudinal_reinforcement": [
+        {"bar_diameter_mm": 15.875, "bar_count": 14, "bar_x_columns": 2, "bar_y_matrix": [6, 6]}
+    ],
+    "extracted_at": "2025-11-21T00:00:00",
+    "validated": False,
+    "validation_notes": None,
+}
+
+
+@pytest.fixture
+def heal_calls(monkeypatch) -> list:
+    """Clear the cache and record every uncached heal_extraction call."""
+    routes._heal_cache.clear()
+    calls = []
+
+    class CountingValidator(ACIValidator):
+        @staticmethod
+        def heal_extraction(extraction_data, exposure, compute_defaults=False):
+            calls.append(exposure)
+            return ACIValidator.heal_extraction(extraction_data, exposure, compute_defaults)
+
+    monkeypatch.setattr(routes, "get_aci_validator", lambda: CountingValidator())
+    return calls
+
+
+def test_volatile_metadata_does_not_defeat_the_cache(client, heal_calls):
+    responses = []
+    for second in range(3):
+        body = {**copy.deepcopy(EXTRACTION), "extracted_at": f"2025-11-21T00:00:0{second}"}
+        responses.append(client.post(VALIDATE_URL, json=body).json())
+
+    assert len(heal_calls) == 1
+    assert [r["data"]["extracted_at"] for r in responses] == [
+        "2025-11-21T00:00:00", "2025-11-21T00:00:01", "2025-11-21T00:00:02"
+    ]
+    assert responses[0]["corrections"] == responses[2]["corrections"]
+    assert responses[2]["data"]["concrete_specifications"]["clear_cover_mm"] == 38.1
+
+
+def test_key_order_is_preserved(client, heal_calls):
+    for _ in range(2):
+        data = client.post(VALIDATE_URL, json=copy.deepcopy(EXTRACTION)).json()["data"]
+        assert list(data) == list(EXTRACTION)
+
+    assert len(heal_calls) == 1
+
+
+def test_exposure_is_part_of_the_key(client, heal_calls):
+    client.post(VALIDATE_URL, json=copy.deepcopy(EXTRACTION))
+    data = client.post(
+        VALIDATE_URL,
+        params={"exposure": "cast_against_earth"},
+        json=copy.deepcopy(EXTRACTION)
+    ).json()["data"]
+
+    assert len(heal_calls) == 2
+    assert data["concrete_specifications"]["clear_cover_mm"] == 76.2
+
+
+def test_cache_hits_return_independent_objects(heal_calls):
+    first, _ = routes.heal_extraction_cached(copy.deepcopy(EXTRACTION), routes.ExposureCondition.INTERIOR_BEAMS_COLUMNS)
+    first["concrete_specifications"]["clear_cover_mm"] = 0
+
+    second, _ = routes.heal_extraction_cached(copy.deepcopy(EXTRACTION), routes.ExposureCondition.INTERIOR_BEAMS_COLUMNS)
+
+    assert second["concrete_specifications"]["clear_cover_mm"] == 38.1
+    assert len(heal_calls) == 1
+
+
+@pytest.mark.parametrize("notes", ["", "x" * routes.HEAL_CACHE_MAX_PAYLOAD_BYTES])
+def test_input_is_never_mutated(heal_calls, notes):
+    body = {**copy.deepcopy(EXTRACTION), "notes": notes}
+    original = copy.deepcopy(body)
+
+    for _ in range(2):
+        healed, _ = routes.heal_extraction_cached(body, routes.ExposureCondition.INTERIOR_BEAMS_COLUMNS)
+        assert healed["concrete_specifications"]["clear_cover_mm"] == 38.1
+
+    assert body == original
+
+
+def test_oversized_payloads_are_not_cached(client, heal_calls):
+    body = {**copy.deepcopy(EXTRACTION), "notes": "x" * routes.HEAL_CACHE_MAX_PAYLOAD_BYTES}
+
+    for _ in range(2):
+        assert client.post(VALIDATE_URL, json=copy.deepcopy(body)).status_code == 200
+
+    assert len(heal_calls) == 2
+    assert len(routes._heal_cache) == 0
+
+
+def test_cache_is_bounded(heal_calls, monkeypatch):
+    monkeypatch.setattr(routes, "HEAL_CACHE_SIZE", 3)
+
+    for element_id in range(5):
+        body = copy.deepcopy(EXTRACTION)
+        body["element_identification"]["element_id"] = f"C-{element_id}"
+        routes.heal_extraction_cached(body, routes.ExposureCondition.INTERIOR_BEAMS_COLUMNS)
+
+    assert len(routes._heal_cache) == 3
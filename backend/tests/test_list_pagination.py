@@ -0,0 +1,82 @@
+# File: backend/tests/test_list_pagination.py
+"""Keyset pagination for GET /api/v1/extractions."""
+
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+LIST_URL = "/api/v1/extractions"
+
+
+def fetch_all_pages(client, limit: int, **params) -> list:
+    """Follow next_cursor until the listing is exhausted."""
+    ids = []
+    before = None
+    while True:
+        query = {"limit": limit, **params}
+        if before is not None:
+            query["before"] = before
+        body = client.get(LIST_URL, params=query).json()
+        ids.extend(document["_id"] for document in body["data"])
+        before = body["next_cursor"]
+        if before is None:
+            return ids
+
+
+def test_bulk_batch_larger_than_page_is_not_skipped(client, extractions):
+    # Every document in one bulk save shares the same saved_at
+    saved = client.post(f"{LIST_URL}/bulk", json=[{"n": i} for i in range(45)]).json()["ids"]
+    assert len({document["saved_at"] for document in extractions.documents}) == 1
+
+    listed = fetch_all_pages(client, limit=20)
+
+    assert sorted(listed) == sorted(saved)
+    assert len(listed) == len(set(listed))
+
+
+def test_pages_are_newest_first_with_id_tie_break(client, extractions):
+    base = datetime(2025, 1, 1)
+    extractions.documents = [
+        {"_id": ObjectId(), "saved_at": base + timedelta(seconds=i // 3), "validated": i % 2 == 0}
+        for i in range(20)
+    ]
+    expected = [
+        str(document["_id"])
+        for document in sorted(
+            extractions.documents,
+            key=lambda document: (document["saved_at"], document["_id"]),
+            reverse=True
+        )
+    ]
+
+    for limit in (1, 2, 3, 7, 20, 100):
+        assert fetch_all_pages(client, limit=limit) == expected
+
+
+def test_validated_only_pages_with_cursor(client, extractions):
+    base = datetime(2025, 1, 1)
+    extractions.documents = [
+        {"_id": ObjectId(), "saved_at": base, "validated": i % 3 == 0}
+        for i in range(30)
+    ]
+    expected = {str(document["_id"]) for document in extractions.documents if document["validated"]}
+
+    listed = fetch_all_pages(client, limit=4, validated_only=True)
+
+    assert set(listed) == expected
+    assert len(listed) == len(expected)
+
+
+def test_last_partial_page_has_no_cursor(client, extractions):
+    extractions.documents = [{"_id": ObjectId(), "saved_at": datetime(2025, 1, 1)}]
+
+    body = client.get(LIST_URL, params={"limit": 5}).json()
+
+    assert body["count"] == 1
+    assert body["next_cursor"] is None
+
+
+def test_malformed_cursor_is_rejected(client, extractions):
+    response = client.get(LIST_URL, params={"before": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -3,13 +3,41 @@
  * 3D viewer for reinforcement visualization using Three.js.
  */
 
-import React, { Suspense } from 'react';
+import React, { Suspense, useMemo } from 'react';
 import { Canvas } from '@react-three/fiber';
 import { OrbitControls, Grid, PerspectiveCamera } from '@react-three/drei';
 import * as THREE from 'three';
 import { useExtractionStore } from '../store/useExtractionStore';
 import './Viewer3D.css';
 
+// Geometry groups arrive as flat Float32 coordinate arrays ([x0, y0, z0, x1, ...]).
+// Expand them into per-bar and per-stirrup [x, y, z] points for rendering.
+function expandBarGroups(groups) {
+  return groups.flatMap((group) =>
+    Array.from({ length: group.count }, (_, idx) => {
+      const offset = idx * group.stride;
+      return {
+        start: group.start.slice(offset, offset + 3),
+        end: group.end.slice(offset, offset + 3),
+        diameter_mm: group.diameter_mm[idx],
+      };
+    })
+  );
+}
+
+function expandStirrupGroups(groups) {
+  return groups.flatMap((group) => {
+    const pathLength = group.points_per_path * group.stride;
+    return Array.from({ length: group.count }, (_, level) => {
+      const path = [];
+      for (let offset = level * pathLength; offset < (level + 1) * pathLength; offset += group.stride) {
+        path.push(group.positions.slice(offset, offset + 3));
+      }
+      return { path, diameter_mm: group.diameter_mm };
+    });
+  });
+}
+
 // Longitudinal bar component
 function LongitudinalBar({ barData, section }) {
   // Transform coordinates: Engineering Z-up to Three.js Y-up
@@ -19,14 +47,14 @@ function LongitudinalBar({ barData, section }) {
   const offsetZ = -section.depth_mm / 2;
 
   const start = [
-    barData.start.x + offsetX,
-    barData.start.z,
-    barData.start.y + offsetZ
+    barData.start[0] + offsetX,
+    barData.start[2],
+    barData.start[1] + offsetZ
   ];
   const end = [
-    barData.end.x + offsetX,
-    barData.end.z,
-    barData.end.y + offsetZ
+    barData.end[0] + offsetX,
+    barData.end[2],
+    barData.end[1] + offsetZ
   ];
   const radius = barData.diameter_mm / 2;
 
@@ -56,7 +84,7 @@ function LongitudinalBar({ barData, section }) {
 // Stirrup component
 function Stirrup({ stirrupData }) {
   // Transform coordinates: Engineering Z-up to Three.js Y-up
-  const points = stirrupData.path.map((pt) => [pt.x, pt.z, pt.y]);
+  const points = stirrupData.path.map(([x, y, z]) => [x, z, y]);
   const radius = stirrupData.diameter_mm / 2;
 
   return (
@@ -140,6 +168,15 @@ function ConcreteSection({ section }) {
 function Scene() {
   const { geometry } = useExtractionStore();
 
+  const bars = useMemo(
+    () => (geometry ? expandBarGroups(geometry.longitudinal_bars) : []),
+    [geometry]
+  );
+  const stirrups = useMemo(
+    () => (geometry ? expandStirrupGroups(geometry.stirrups) : []),
+    [geometry]
+  );
+
   if (!geometry) {
     return (
       <group>
@@ -149,7 +186,7 @@ function Scene() {
     );
   }
 
-  const { longitudinal_bars, stirrups, section } = geometry;
+  const { section } = geometry;
 
   return (
     <group>
@@ -164,7 +201,7 @@ function Scene() {
         <ConcreteSection section={section} />
 
         {/* Longitudinal bars */}
-        {longitudinal_bars.map((bar, idx) => (
+        {bars.map((bar, idx) => (
           <LongitudinalBar key={`bar-${idx}`} barData={bar} section={section} />
         ))}
 